@@ -1,8 +1,14 @@
 """Configuration file parser for maze generator."""
 
+from exception import ConfigError, ConfigParsing
+
 
 class ConfigParser:
-    """Parse configuration files for maze generation."""
+    """Parse configuration files for maze generation.
+
+    Thin wrapper around ConfigParsing that exposes the raw key/value
+    pairs through typed getters. Keys are case-insensitive.
+    """
 
     def __init__(self, filepath: str) -> None:
         self.filepath = filepath
@@ -10,53 +16,43 @@ class ConfigParser:
 
     def parse(self):
         try:
-            with open(self.filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-
-                    if not line or line.startswith('#'):
-                        continue
-
-                    if '=' not in line:
-                        raise ValueError(f"Invalid line: {line}")
-
-                    key, value = line.split('=', 1)
-                    self.config[key.strip()] = value.strip()
-
-            return self.config
-
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Config file not found: {self.filepath}")
+            self.config = dict(ConfigParsing()._raw_parse(self.filepath))
+        except ConfigError as e:
+            if isinstance(e.__cause__, FileNotFoundError):
+                raise FileNotFoundError(
+                    f"Config file not found: {self.filepath}"
+                ) from e
+            raise ValueError(str(e)) from e
+        return self.config
 
     def get_int(self, key: str) -> int:
         try:
-            return int(self.config[key])
+            return int(self.config[key.lower()])
         except ValueError:
             raise ValueError(
-                f"Invalid integer for {key}: {self.config[key]}"
+                f"Invalid integer for {key}: {self.config[key.lower()]}"
             )
         except KeyError:
             raise KeyError(f"Missing key: {key}")
 
     def get_bool(self, key: str) -> bool:
-        value = self.config[key].lower()
+        value = self.config[key.lower()].lower()
         if value in ('true', '1', 'yes'):
             return True
         elif value in ('false', '0', 'no'):
             return False
         else:
             raise ValueError(
-                f"Invalid boolean for {key}: {self.config[key]}"
+                f"Invalid boolean for {key}: {self.config[key.lower()]}"
             )
 
     def get_coords(self, key: str):
+        value = self.config[key.lower()]
         try:
-            x, y = self.config[key].split(',')
+            x, y = value.split(',')
             return (int(x.strip()), int(y.strip()))
         except Exception:
-            raise ValueError(
-                f"Invalid coordinates for {key}: {self.config[key]}"
-            )
+            raise ValueError(f"Invalid coordinates for {key}: {value}")
 
     def get_str(self, key: str, default: str = "") -> str:
-        return self.config.get(key, default)
+        return self.config.get(key.lower(), default)
@@ -2,7 +2,62 @@
 
 """Custom exceptions for the AmazeIng maze generator."""
 
-from typing import Any, Dict, Tuple
+import hashlib
+import mmap
+import os
+import re
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import (Any, Callable, Dict, FrozenSet, Iterable, Iterator,
+                    List, Tuple)
+
+MAX_DIMENSION: int = 1000
+
+# Error message templates, bound once at import time.
+_MSG_BAD_LINE = (
+    "Invalid line format: expected 'key=value', got '{line}'"
+).format
+_MSG_NOT_FOUND = "Config file '{source}' not found".format
+_MSG_NOT_UTF8 = "Config file '{source}' is not valid UTF-8".format
+_MSG_BAD_DATA_TYPE = "data must be bytes or str, not {type}".format
+_MSG_MISSING = "{name} not found in config file".format
+_MSG_NOT_INTEGER = "{name} must be an integer".format
+_MSG_BAD_COORD = "{name} must be in format: x,y".format
+_MSG_NOT_POSITIVE = "{name} must be positive, got {value}".format
+_MSG_TOO_LARGE = "{name} too large (max {max}), got {value}".format
+_MSG_OUT_OF_BOUNDS = "{kind} {coord} is out of bounds (0-{x}, 0-{y})".format
+
+_READ_ALL_LIMIT: int = 4 << 20
+
+# key, '=' or ':' separator, value, optional trailing '#' comment
+_LINE_RE: "re.Pattern[str]" = re.compile(
+    r"^\s*([^=:#\s][^=:#]*?)\s*[=:]\s*([^#\n]*?)\s*(?:#.*)?$"
+)
+# blank line or whole-line comment
+_SKIP_RE: "re.Pattern[str]" = re.compile(r"\s*(?:#|$)")
+# 'x,y' coordinate pair, surrounding whitespace allowed
+_COORD_RE: "re.Pattern[str]" = re.compile(
+    r"^\s*([+-]?\d+)\s*,\s*([+-]?\d+)\s*$"
+)
+
+# (key, value) string pairs in file order, duplicates included
+_Pairs = Tuple[Tuple[str, str], ...]
+
+_CACHE_SIZE: int = 16
+# (abspath, inode, mtime_ns, ctime_ns, size, stop_after) -> raw key/value
+# pairs; ctime catches same-size rewrites whose mtime was put back
+_PARSE_CACHE: "OrderedDict[Tuple[Any, ...], _Pairs]" = OrderedDict()
+# (BLAKE2b digest of file contents, stop_after) -> raw key/value pairs
+_HASH_CACHE: "OrderedDict[Tuple[Any, ...], _Pairs]" = OrderedDict()
+
+
+def _cache_put(cache: "OrderedDict[Any, Any]", key: Any, value: Any) -> None:
+    """Insert into an LRU cache, evicting the oldest entry when full."""
+    cache[key] = value
+    if len(cache) > _CACHE_SIZE:
+        cache.popitem(last=False)
 
 
 class MazeError(Exception):
@@ -25,6 +80,168 @@ class InvalidCoordinatesError(MazeError):
     pass
 
 
+class CoordinatesOutOfBoundsError(InvalidCoordinatesError):
+    """Raised when entry or exit coordinates lie outside the maze.
+
+    The message is only formatted when the exception is displayed.
+    """
+
+    def __init__(self, kind: str, coord: Tuple[int, int], width: int,
+                 height: int) -> None:
+        super().__init__(kind, coord, width, height)
+        self.kind = kind
+        self.coord = coord
+        self.width = width
+        self.height = height
+
+    def __str__(self) -> str:
+        return _MSG_OUT_OF_BOUNDS(kind=self.kind, coord=self.coord,
+                                  x=self.width - 1, y=self.height - 1)
+
+
+def _parse_dimension(value: str, name: str) -> int:
+    """Convert a dimension value to an integer."""
+    if not value.isdecimal():
+        # Allow one sign so negative sizes are reported as "must be positive".
+        if value[:1] not in ("+", "-") or not value[1:].isdecimal():
+            raise InvalidDimensionsError(_MSG_NOT_INTEGER(name=name))
+    return int(value)
+
+
+def _parse_coord(value: str, name: str) -> Tuple[int, int]:
+    """Convert an 'x,y' value to a coordinate tuple."""
+    match = _COORD_RE.match(value)
+    if match is None:
+        raise InvalidCoordinatesError(_MSG_BAD_COORD(name=name))
+    return (int(match.group(1)), int(match.group(2)))
+
+
+@lru_cache(maxsize=64)
+def _validate(width: int, height: int, entry: Tuple[int, int],
+              exit_coord: Tuple[int, int]) -> None:
+    """Check dimensions and coordinates of a parsed configuration.
+
+    Raises:
+        InvalidDimensionsError: If dimensions are out of range.
+        InvalidCoordinatesError: If coordinates are out of bounds.
+    """
+    # Cheapest and most commonly failing checks come first.
+    if entry == exit_coord:
+        raise InvalidCoordinatesError("Entry and exit cannot be the same")
+
+    if width <= 0:
+        raise InvalidDimensionsError(
+            _MSG_NOT_POSITIVE(name="Width", value=width)
+        )
+    if height <= 0:
+        raise InvalidDimensionsError(
+            _MSG_NOT_POSITIVE(name="Height", value=height)
+        )
+
+    if width > MAX_DIMENSION:
+        raise InvalidDimensionsError(
+            _MSG_TOO_LARGE(name="Width", max=MAX_DIMENSION, value=width)
+        )
+    if height > MAX_DIMENSION:
+        raise InvalidDimensionsError(
+            _MSG_TOO_LARGE(name="Height", max=MAX_DIMENSION, value=height)
+        )
+
+    entry_x, entry_y = entry
+    exit_x, exit_y = exit_coord
+    if not (0 <= entry_x < width and 0 <= entry_y < height):
+        raise CoordinatesOutOfBoundsError("Entry", entry, width, height)
+    if not (0 <= exit_x < width and 0 <= exit_y < height):
+        raise CoordinatesOutOfBoundsError("Exit", exit_coord, width, height)
+
+
+# Maps each recognised config key to the function converting its value.
+_KEY_HANDLERS: Dict[str, Callable[[str], Any]] = {
+    "width": partial(_parse_dimension, name="Width"),
+    "height": partial(_parse_dimension, name="Height"),
+    "entry": partial(_parse_coord, name="Entry"),
+    "exit": partial(_parse_coord, name="Exit"),
+    "output_file": str,
+    "algorithm": str,
+}
+_KNOWN_KEYS: FrozenSet[str] = frozenset(_KEY_HANDLERS)
+
+
+def _read_bytes(filename: str) -> Tuple[bytes, os.stat_result]:
+    """Read a whole file, skipping the atime update where supported.
+
+    Returns:
+        The file contents and the stat of the descriptor they were read from.
+    """
+    try:
+        fd = os.open(filename, os.O_RDONLY | getattr(os, "O_NOATIME", 0))
+    except PermissionError:
+        # O_NOATIME is only allowed for the file's owner.
+        fd = os.open(filename, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        size = max(st.st_size, 1 << 12)
+        chunks = []
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks), st
+
+
+@dataclass(slots=True, frozen=True)
+class MazeConfig:
+    """Validated maze configuration returned by ConfigParsing."""
+
+    width: int
+    height: int
+    entry: Tuple[int, int]
+    exit: Tuple[int, int]
+    output_file: str
+    algorithm: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the configuration as a plain dictionary."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "entry": self.entry,
+            "exit": self.exit,
+            "output_file": self.output_file,
+            "algorithm": self.algorithm,
+        }
+
+
+def _early_exit_keys() -> FrozenSet[str] | None:
+    """Return the keys to stop reading after, if early exit is enabled.
+
+    Opt-in via AMAZEING_EARLY_PARSE_EXIT=1: later lines are then neither
+    checked nor allowed to override earlier values.
+    """
+    if os.environ.get("AMAZEING_EARLY_PARSE_EXIT") == "1":
+        return _KNOWN_KEYS
+    return None
+
+
+def _mmap_lines(mm: mmap.mmap) -> Iterator[str]:
+    """Yield the lines of a memory-mapped file, as str.splitlines() would.
+
+    Only one newline-delimited slice is copied and decoded at a time.
+    """
+    size = len(mm)
+    pos = 0
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end == -1:
+            end = size
+        # Split again so other line breaks behave as in the in-memory path.
+        yield from mm[pos:end].decode("utf-8").splitlines()
+        pos = end + 1
+
+
 class ConfigParsing:
     """Parser for maze configuration files."""
     
@@ -41,155 +258,234 @@ class ConfigParsing:
         Raises:
             ConfigError: If line format is invalid.
         """
-        if "=" in line:
-            key, value = line.split("=", 1)
+        match = _LINE_RE.match(line)
+        if match is None:
+            raise ConfigError(_MSG_BAD_LINE(line=line))
+        key = match.group(1)
+        # Most keys are already lowercase; skip the copy for those.
+        if not key.islower():
+            key = key.lower()
+        # Interned keys hit the identity fast path in handler lookups.
+        return sys.intern(key), match.group(2)
+
+    def _tokenize(self, lines: Iterable[str],
+                  stop_after: FrozenSet[str] | None = None) -> _Pairs:
+        """Split configuration lines into lowercase keys and raw values.
+
+        Args:
+            lines: Configuration lines, with or without line endings.
+            stop_after: If given, stop reading once all these keys are seen.
+
+        Returns:
+            (key, value) pairs in file order, with lowercase keys.
+
+        Raises:
+            ConfigError: If a line is malformed.
+        """
+        pairs: List[Tuple[str, str]] = []
+        remaining = set(stop_after) if stop_after else None
+        for line in lines:
+            # Skip empty lines and comments
+            if _SKIP_RE.match(line):
+                continue
+
+            key, value = self.parse_line(line)
+            pairs.append((key, value))
+            if remaining is not None:
+                remaining.discard(key)
+                if not remaining:
+                    break
+        return tuple(pairs)
+
+    def _raw_parse_bytes(self, data: bytes | str, source_name: str,
+                         stop_after: FrozenSet[str] | None = None
+                         ) -> _Pairs:
+        """Tokenize in-memory configuration data into key/value strings.
+
+        Args:
+            data: Raw configuration file contents, as bytes or text.
+            source_name: Name used for the data in error messages.
+            stop_after: If given, stop reading once all these keys are seen.
+
+        Returns:
+            (key, value) pairs in file order, with lowercase keys.
+
+        Raises:
+            ConfigError: If data is not UTF-8 or a line is malformed.
+        """
+        if isinstance(data, str):
+            text: str | None = data
+            try:
+                # Strict, so text and bytes share cache entries only when
+                # the bytes are valid UTF-8 themselves.
+                data = data.encode("utf-8")
+            except UnicodeEncodeError as e:
+                raise ConfigError(_MSG_NOT_UTF8(source=source_name)) from e
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            text = None
         else:
-            raise ConfigError("Invalid line format: expected '='")
+            raise TypeError(_MSG_BAD_DATA_TYPE(type=type(data).__name__))
+
+        # Same content under another path or timestamp parses the same.
+        digest = (hashlib.blake2b(data, digest_size=16).digest(), stop_after)
+        if digest in _HASH_CACHE:
+            _HASH_CACHE.move_to_end(digest)
+            return _HASH_CACHE[digest]
+
+        if text is None:
+            try:
+                text = bytes(data).decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise ConfigError(_MSG_NOT_UTF8(source=source_name)) from e
+        pairs = self._tokenize(text.splitlines(), stop_after)
+        _cache_put(_HASH_CACHE, digest, pairs)
+        return pairs
+
+    def _raw_parse(self, filename: str,
+                   stop_after: FrozenSet[str] | None = None
+                   ) -> _Pairs:
+        """Read a configuration file into unvalidated key/value strings.
 
-        key = key.strip().lower()
-        value = value.split("#")[0].strip()
-        return key, value
+        Args:
+            filename: Path to configuration file.
+            stop_after: If given, stop reading once all these keys are seen.
 
-    def parse(self, filename: str) -> Dict[str, Any]:
+        Returns:
+            (key, value) pairs in file order, with lowercase keys.
+
+        Raises:
+            ConfigError: If file not found or a line is malformed.
+        """
+        try:
+            path = os.path.abspath(filename)
+            st = os.stat(filename)
+            cache_key = (path, st.st_ino, st.st_mtime_ns, st.st_ctime_ns,
+                         st.st_size, stop_after)
+            if cache_key in _PARSE_CACHE:
+                _PARSE_CACHE.move_to_end(cache_key)
+                return _PARSE_CACHE[cache_key]
+
+            # The file may have been replaced since the stat above, so the
+            # result is cached under the stat of the descriptor actually read.
+            if st.st_size < _READ_ALL_LIMIT:
+                data, st = _read_bytes(filename)
+                pairs = self._raw_parse_bytes(data, filename, stop_after)
+            else:
+                # Huge files are scanned in place rather than read in one go.
+                with open(filename, "rb") as file, mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm:
+                    st = os.fstat(file.fileno())
+                    pairs = self._tokenize(_mmap_lines(mm), stop_after)
+            cache_key = (path, st.st_ino, st.st_mtime_ns, st.st_ctime_ns,
+                         st.st_size, stop_after)
+
+        except FileNotFoundError as e:
+            raise ConfigError(_MSG_NOT_FOUND(source=filename)) from e
+        except UnicodeDecodeError as e:
+            raise ConfigError(_MSG_NOT_UTF8(source=filename)) from e
+
+        _cache_put(_PARSE_CACHE, cache_key, pairs)
+        return pairs
+
+    def parse(self, filename: str) -> MazeConfig:
         """Parse configuration file and return maze parameters.
 
         Args:
             filename: Path to configuration file.
 
         Returns:
-            Dictionary containing maze configuration with keys:
-            width, height, entry, exit, output_file, algorithm.
+            MazeConfig holding width, height, entry, exit, output_file
+            and algorithm.
 
         Raises:
             ConfigError: If file not found or cannot be read.
             InvalidDimensionsError: If dimensions are invalid.
             InvalidCoordinatesError: If coordinates are invalid.
         """
-        width: int | None = None
-        height: int | None = None
-        entry: Tuple[int, int] | None = None
-        exit_coord: Tuple[int, int] | None = None
-        output_file: str | None = None
-        algorithm: str = "recursive_backtracking"
+        return self._build_config(
+            self._raw_parse(filename, _early_exit_keys())
+        )
 
-        try:
-            with open(filename, "r") as file:
-                for line in file:
-                    line = line.strip()
-
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-
-                    try:
-                        key, value = self.parse_line(line)
-                    except ConfigError:
-                        raise
-
-                    if key == "width":
-                        try:
-                            width = int(value)
-                        except ValueError as e:
-                            raise InvalidDimensionsError(
-                                "Width must be an integer"
-                            ) from e
-
-                    elif key == "height":
-                        try:
-                            height = int(value)
-                        except ValueError as e:
-                            raise InvalidDimensionsError(
-                                "Height must be an integer"
-                            ) from e
-
-                    elif key == "entry":
-                        try:
-                            x, y = value.split(",")
-                            entry = (int(x.strip()), int(y.strip()))
-                        except (ValueError, IndexError) as e:
-                            raise InvalidCoordinatesError(
-                                "Entry must be in format: x,y"
-                            ) from e
-
-                    elif key == "exit":
-                        try:
-                            x, y = value.split(",")
-                            exit_coord = (int(x.strip()), int(y.strip()))
-                        except (ValueError, IndexError) as e:
-                            raise InvalidCoordinatesError(
-                                "Exit must be in format: x,y"
-                            ) from e
-
-                    elif key == "output_file":
-                        output_file = value
-
-                    elif key == "algorithm":
-                        algorithm = value
+    def parse_from_bytes(self, data: bytes | str,
+                         source_name: str = "<bytes>") -> MazeConfig:
+        """Parse configuration already held in memory.
 
-        except FileNotFoundError as e:
-            raise ConfigError(f"Config file '{filename}' not found") from e
+        Args:
+            data: Raw configuration file contents, as bytes or text.
+            source_name: Name used for the data in error messages.
+
+        Returns:
+            MazeConfig, as for parse().
+
+        Raises:
+            TypeError: If data is neither bytes nor str.
+            ConfigError: If data cannot be decoded or parsed.
+            InvalidDimensionsError: If dimensions are invalid.
+            InvalidCoordinatesError: If coordinates are invalid.
+        """
+        return self._build_config(
+            self._raw_parse_bytes(data, source_name, _early_exit_keys())
+        )
+
+    @staticmethod
+    def _build_config(pairs: _Pairs) -> MazeConfig:
+        """Convert and validate raw key/value strings.
+
+        Every value is converted in file order, so a malformed value is
+        reported even if a later line sets the same key again. Malformed
+        lines are reported before any value, as tokenizing comes first.
+
+        Args:
+            pairs: (key, value) pairs in file order, with lowercase keys.
+
+        Returns:
+            MazeConfig, as for parse().
+
+        Raises:
+            InvalidDimensionsError: If dimensions are invalid.
+            InvalidCoordinatesError: If coordinates are invalid.
+        """
+        out: Dict[str, Any] = {}
+        for key, value in pairs:
+            handler = _KEY_HANDLERS.get(key)
+            if handler is not None:
+                out[key] = handler(value)
+
+        width: int | None = out.get("width")
+        height: int | None = out.get("height")
+        entry: Tuple[int, int] | None = out.get("entry")
+        exit_coord: Tuple[int, int] | None = out.get("exit")
+        output_file: str | None = out.get("output_file")
+        algorithm: str = out.get("algorithm", "recursive_backtracking")
 
         if width is None:
-            raise InvalidDimensionsError("Width not found in config file")
+            raise InvalidDimensionsError(_MSG_MISSING(name="Width"))
         if height is None:
-            raise InvalidDimensionsError("Height not found in config file")
+            raise InvalidDimensionsError(_MSG_MISSING(name="Height"))
         if entry is None:
-            raise InvalidCoordinatesError("Entry not found in config file")
+            raise InvalidCoordinatesError(_MSG_MISSING(name="Entry"))
         if exit_coord is None:
-            raise InvalidCoordinatesError("Exit not found in config file")
+            raise InvalidCoordinatesError(_MSG_MISSING(name="Exit"))
         if output_file is None:
-            raise InvalidDimensionsError("Output file not found in config file"
-                                         )
-        if width <= 0:
-            raise InvalidDimensionsError(f"Width must be positive, got {width}"
-                                         )
-        if height <= 0:
-            raise InvalidDimensionsError(f"Height must be positive, got\
-{height}")
-
-        max_dimension: int = 1000
-        if width > max_dimension:
-            raise InvalidDimensionsError(
-                f"Width too large (max {max_dimension}), got {width}"
-            )
-        if height > max_dimension:
-            raise InvalidDimensionsError(
-                f"Height too large (max {max_dimension}), got {height}"
-            )
-        entry_x, entry_y = entry
-        exit_x, exit_y = exit_coord
-
-        if entry_x < 0 or entry_x >= width or entry_y < 0 or entry_y >= height:
-            raise InvalidCoordinatesError(f"Entry {entry} is out of bounds (0-\
-{width - 1}, 0-{height - 1})")
-        if exit_x < 0 or exit_x >= width or exit_y < 0 or exit_y >= height:
-            raise InvalidCoordinatesError(f"Exit {exit_coord} is out of bounds\
- (0-{width - 1}, 0-{height - 1})")
-
-        if entry == exit_coord:
-            raise InvalidCoordinatesError("Entry and exit cannot be the same")
+            raise InvalidDimensionsError(_MSG_MISSING(name="Output file"))
+        _validate(width, height, entry, exit_coord)
 
-        return {
-            "width": width,
-            "height": height,
-            "entry": entry,
-            "exit": exit_coord,
-            "output_file": output_file,
-            "algorithm": algorithm,
-        }
+        return MazeConfig(width, height, entry, exit_coord, output_file,
+                          algorithm)
 
 
 if __name__ == "__main__":
     parser: ConfigParsing = ConfigParsing()
 
     try:
-        config: Dict[str, Any] = parser.parse("config.txt")
+        config: MazeConfig = parser.parse("config.txt")
         print("Configuration loaded successfully!")
-        print(f"Width: {config['width']}")
-        print(f"Height: {config['height']}")
-        print(f"Entry: {config['entry']}")
-        print(f"Exit: {config['exit']}")
-        print(f"Output file: {config['output_file']}")
-        print(f"Algorithm: {config['algorithm']}")
+        print(f"Width: {config.width}")
+        print(f"Height: {config.height}")
+        print(f"Entry: {config.entry}")
+        print(f"Exit: {config.exit}")
+        print(f"Output file: {config.output_file}")
+        print(f"Algorithm: {config.algorithm}")
     except MazeError as e:
         print(f"Error: {e}")
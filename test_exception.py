@@ -0,0 +1,230 @@
+"""Tests for the maze configuration parser."""
+
+import os
+import pickle
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import exception
+from exception import (_CACHE_SIZE, _HASH_CACHE, _PARSE_CACHE,
+                       _READ_ALL_LIMIT, ConfigError, ConfigParsing,
+                       CoordinatesOutOfBoundsError, InvalidCoordinatesError,
+                       InvalidDimensionsError)
+
+
+CONFIG = (
+    "WIDTH=20\n"
+    "HEIGHT=25\n"
+    "ENTRY=0,0\n"
+    "EXIT=18,24\n"
+    "OUTPUT_FILE=maze.txt\xa0\n"
+    "ALGORITHM=prim # comment\n"
+)
+
+
+class TestLargeFileParsing(unittest.TestCase):
+    """Files at or above _READ_ALL_LIMIT go through the mmap path."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _write(self, name: str, text: str) -> str:
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        return path
+
+    def _write_pair(self, text: str) -> tuple[str, str]:
+        small = self._write("small.txt", text)
+        padding = "# padding\n" * (_READ_ALL_LIMIT // 10 + 1)
+        large = self._write("large.txt", padding + text)
+        self.assertLess(os.path.getsize(small), _READ_ALL_LIMIT)
+        self.assertGreaterEqual(os.path.getsize(large), _READ_ALL_LIMIT)
+        return small, large
+
+    def test_same_result_as_small_file(self) -> None:
+        small, large = self._write_pair(CONFIG)
+        parser = ConfigParsing()
+        self.assertEqual(parser.parse(small), parser.parse(large))
+        self.assertEqual(parser.parse(large).output_file, "maze.txt")
+
+    def test_same_error_as_small_file(self) -> None:
+        small, large = self._write_pair(CONFIG + "SEED=4\x0c2\n")
+        parser = ConfigParsing()
+        with self.assertRaises(ConfigError) as small_err:
+            parser.parse(small)
+        with self.assertRaises(ConfigError) as large_err:
+            parser.parse(large)
+        self.assertEqual(str(small_err.exception), str(large_err.exception))
+
+
+class TestParseCache(unittest.TestCase):
+    """The parse cache never serves contents that have since changed."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "config.txt")
+        _PARSE_CACHE.clear()
+        _HASH_CACHE.clear()
+
+    def _write(self, text: str, path: str | None = None) -> None:
+        with open(path or self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_hit_skips_reading(self) -> None:
+        self._write(CONFIG)
+        parser = ConfigParsing()
+        with mock.patch.object(exception, "_read_bytes",
+                               wraps=exception._read_bytes) as read:
+            first = parser.parse(self.path)
+            second = parser.parse(self.path)
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_rewrite_invalidates(self) -> None:
+        self._write(CONFIG)
+        parser = ConfigParsing()
+        self.assertEqual(parser.parse(self.path).width, 20)
+        self._write(CONFIG.replace("WIDTH=20", "WIDTH=100"))
+        self.assertEqual(parser.parse(self.path).width, 100)
+
+    def test_lru_eviction(self) -> None:
+        parser = ConfigParsing()
+        paths = []
+        for i in range(_CACHE_SIZE + 1):
+            path = os.path.join(self.tmpdir.name, f"config{i}.txt")
+            self._write(CONFIG.replace("WIDTH=20", f"WIDTH={20 + i}"), path)
+            parser.parse(path)
+            paths.append(os.path.abspath(path))
+
+        self.assertEqual(len(_PARSE_CACHE), _CACHE_SIZE)
+        self.assertEqual(len(_HASH_CACHE), _CACHE_SIZE)
+        cached_paths = {key[0] for key in _PARSE_CACHE}
+        self.assertNotIn(paths[0], cached_paths)
+        self.assertEqual(cached_paths, set(paths[1:]))
+
+        # A hit makes an entry most recent, so the next-oldest goes instead.
+        parser.parse(paths[1])
+        extra = os.path.join(self.tmpdir.name, "extra.txt")
+        self._write(CONFIG.replace("WIDTH=20", "WIDTH=99"), extra)
+        parser.parse(extra)
+        cached_paths = {key[0] for key in _PARSE_CACHE}
+        self.assertIn(paths[1], cached_paths)
+        self.assertNotIn(paths[2], cached_paths)
+
+    def test_same_size_rewrite_with_restored_mtime(self) -> None:
+        self._write(CONFIG)
+        parser = ConfigParsing()
+        self.assertEqual(parser.parse(self.path).width, 20)
+        before = os.stat(self.path)
+
+        self._write(CONFIG.replace("WIDTH=20", "WIDTH=30"))
+        os.utime(self.path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        # ctime has coarse granularity; touch again until it moves on.
+        while os.stat(self.path).st_ctime_ns == before.st_ctime_ns:
+            time.sleep(0.01)
+            os.utime(self.path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        after = os.stat(self.path)
+        self.assertEqual(after.st_size, before.st_size)
+        self.assertEqual(after.st_mtime_ns, before.st_mtime_ns)
+
+        self.assertEqual(parser.parse(self.path).width, 30)
+
+
+class TestRepeatedKeys(unittest.TestCase):
+    """Every occurrence of a key is converted, not just the last one."""
+
+    def test_overridden_bad_value_is_reported(self) -> None:
+        data = ("WIDTH=abc\n" + CONFIG).encode()
+        with self.assertRaisesRegex(InvalidDimensionsError, "integer"):
+            ConfigParsing().parse_from_bytes(data)
+
+    def test_last_value_wins(self) -> None:
+        config = ConfigParsing().parse_from_bytes(
+            (CONFIG + "WIDTH=30\n").encode()
+        )
+        self.assertEqual(config.width, 30)
+
+
+class TestParseFromBytes(unittest.TestCase):
+    """parse_from_bytes takes bytes or str buffers."""
+
+    def test_str_and_bytes_agree(self) -> None:
+        parser = ConfigParsing()
+        self.assertEqual(parser.parse_from_bytes(CONFIG),
+                         parser.parse_from_bytes(CONFIG.encode()))
+
+    def test_surrogates_rejected_in_either_order(self) -> None:
+        parser = ConfigParsing()
+        for data in (CONFIG + "SEED=\ud800\n",
+                     (CONFIG + "SEED=").encode() + b"\xed\xa0\x80\n"):
+            with self.assertRaisesRegex(ConfigError, "not valid UTF-8"):
+                parser.parse_from_bytes(data)
+
+    def test_other_types_rejected(self) -> None:
+        with self.assertRaises(TypeError):
+            ConfigParsing().parse_from_bytes(42)
+
+
+class TestEarlyExit(unittest.TestCase):
+    """AMAZEING_EARLY_PARSE_EXIT=1 stops reading once all keys are seen."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "config.txt")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(CONFIG + "not a key value line\n")
+
+    def test_trailing_bad_line_ignored_only_with_flag(self) -> None:
+        parser = ConfigParsing()
+        with mock.patch.dict(os.environ, {"AMAZEING_EARLY_PARSE_EXIT": "1"}):
+            self.assertEqual(parser.parse(self.path).width, 20)
+        # The truncated result above must not be served without the flag.
+        with mock.patch.dict(os.environ):
+            os.environ.pop("AMAZEING_EARLY_PARSE_EXIT", None)
+            with self.assertRaises(ConfigError):
+                parser.parse(self.path)
+
+    def test_flag_does_not_share_hash_cache_entries(self) -> None:
+        data = (CONFIG + "not a key value line\n").encode()
+        parser = ConfigParsing()
+        with mock.patch.dict(os.environ, {"AMAZEING_EARLY_PARSE_EXIT": "1"}):
+            self.assertEqual(parser.parse_from_bytes(data).width, 20)
+        with mock.patch.dict(os.environ):
+            os.environ.pop("AMAZEING_EARLY_PARSE_EXIT", None)
+            with self.assertRaises(ConfigError):
+                parser.parse_from_bytes(data)
+
+
+class TestCoordinatesOutOfBounds(unittest.TestCase):
+    """The lazily formatted error keeps its message and pickles."""
+
+    def _raise(self) -> CoordinatesOutOfBoundsError:
+        data = (CONFIG.replace("WIDTH=20", "WIDTH=3")
+                .replace("HEIGHT=25", "HEIGHT=3")
+                .replace("ENTRY=0,0", "ENTRY=5,5"))
+        with self.assertRaises(InvalidCoordinatesError) as cm:
+            ConfigParsing().parse_from_bytes(data)
+        self.assertIsInstance(cm.exception, CoordinatesOutOfBoundsError)
+        return cm.exception
+
+    def test_message(self) -> None:
+        self.assertEqual(str(self._raise()),
+                         "Entry (5, 5) is out of bounds (0-2, 0-2)")
+
+    def test_pickle_round_trip(self) -> None:
+        error = self._raise()
+        copy = pickle.loads(pickle.dumps(error))
+        self.assertIs(type(copy), CoordinatesOutOfBoundsError)
+        self.assertEqual(str(copy), str(error))
+        self.assertEqual((copy.kind, copy.coord, copy.width, copy.height),
+                         ("Entry", (5, 5), 3, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()